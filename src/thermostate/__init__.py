@@ -1,4 +1,14 @@
 from .abbreviations import EnglishEngineering, SystemInternational  # noqa
-from .thermostate import Q_, State, set_default_units, units  # noqa
+from .thermostate import Q_, State, StateArray, set_default_units, units
+
+__all__ = [
+    "EnglishEngineering",
+    "SystemInternational",
+    "Q_",
+    "State",
+    "StateArray",
+    "set_default_units",
+    "units",
+]
 
 __version__ = "2.0.0.post1"
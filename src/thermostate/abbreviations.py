@@ -68,7 +68,7 @@ class SystemInternational:
     u : `str`
         kJ/kg
     v : `str`
-        m**3/lb
+        m**3/kg
     cv : `str`
         kJ/(K*kg)
     cp : `str`
@@ -84,3 +84,17 @@ class SystemInternational:
     p = "bar"
     cv = "kJ/(K*kg)"
     cp = "kJ/(K*kg)"
+
+
+UNITS = {
+    (system, prop): getattr(abbreviations, prop)
+    for system, abbreviations in (
+        ("EE", EnglishEngineering),
+        ("SI", SystemInternational),
+    )
+    for prop in ("s", "h", "T", "u", "v", "p", "cp", "cv")
+}
+"""`dict`: The units of each property, keyed by the unit system and property name.
+
+For example, ``UNITS["EE", "h"]`` is ``"BTU/lb"``.
+"""
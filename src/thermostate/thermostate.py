@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import enum
+import functools
+import itertools
+import math
 import sys
-from collections import OrderedDict
+import threading
 from typing import TYPE_CHECKING
 
 import CoolProp
@@ -12,8 +15,7 @@ import numpy as np
 from pint import DimensionalityError, UnitRegistry
 from pint.util import UnitsContainer
 
-from .abbreviations import EnglishEngineering as default_EE
-from .abbreviations import SystemInternational as default_SI
+from .abbreviations import UNITS
 
 try:  # pragma: no cover
     from IPython.core.ultratb import AutoFormattedTB
@@ -36,14 +38,9 @@ default_units = None
 
 def set_default_units(units):
     """Set default units to be used in class initialization."""
-    if units is None or units in ("SI", "EE"):
-        global default_units
-        default_units = units
-    else:
-        raise TypeError(
-            f"The given units '{units!r}' are not supported. Must be 'SI', "
-            "'EE', or None."
-        )
+    State._check_units(units)
+    global default_units
+    default_units = units
 
 
 # Don't add the _render_traceback_ function to DimensionalityError if
@@ -112,6 +109,125 @@ def munge_coolprop_input_prop(prop: str) -> str:
     return prop.replace("Q", "X").lower().replace("t", "T")
 
 
+# Names of the ThermoState input properties in CoolProp. Specific volume is
+# passed to CoolProp as the mass density.
+_COOLPROP_INPUT_NAMES = {
+    "T": "T",
+    "p": "P",
+    "v": "Dmass",
+    "u": "Umass",
+    "h": "Hmass",
+    "s": "Smass",
+    "x": "Q",
+}
+
+
+def _build_input_pairs() -> "dict[str, tuple[int, bool]]":
+    """Map each pair of input properties to the CoolProp input pair constant.
+
+    CoolProp names its input pairs with the two properties in sorted order, so
+    each value also records whether the ThermoState pair has to be swapped
+    before it is passed to `CoolProp.AbstractState.update`. Pairs that CoolProp
+    doesn't have a constant for are omitted.
+    """
+    pairs = {}
+    for first, second in itertools.permutations(_COOLPROP_INPUT_NAMES, 2):
+        names = (_COOLPROP_INPUT_NAMES[first], _COOLPROP_INPUT_NAMES[second])
+        constant = getattr(CoolProp, "".join(sorted(names)) + "_INPUTS", None)
+        if constant is not None:
+            pairs[first + second] = (constant, names[0] > names[1])
+    return pairs
+
+
+_INPUT_PAIRS = _build_input_pairs()
+
+# CoolProp output keys for each property of a State
+_OUTPUT_KEYS = {
+    "T": CoolProp.iT,
+    "p": CoolProp.iP,
+    "v": CoolProp.iDmass,
+    "u": CoolProp.iUmass,
+    "h": CoolProp.iHmass,
+    "s": CoolProp.iSmass,
+    "x": CoolProp.iQ,
+    "cp": CoolProp.iCpmass,
+    "cv": CoolProp.iCvmass,
+    "phase": CoolProp.iPhase,
+}
+
+# Names of the CoolProp.CoolProp.PropsSImulti outputs for each property of a State
+_PROPSSI_OUTPUTS = {
+    "T": "T",
+    "p": "P",
+    "v": "Dmass",
+    "u": "Umass",
+    "h": "Hmass",
+    "s": "Smass",
+    "x": "Q",
+    "cp": "Cpmass",
+    "cv": "Cvmass",
+    "phase": "Phase",
+}
+
+
+# The CoolProp backends of each thread, keyed by the substance and backend name
+_THREAD_BACKENDS = threading.local()
+
+
+def _get_backend(substance: str, backend: str = "HEOS") -> CoolProp.AbstractState:
+    """Return the CoolProp `~CoolProp.AbstractState` for a substance in this thread.
+
+    Loading the equation of state for a substance is expensive, so each
+    backend is constructed once per thread and shared by every `State` of that
+    substance that is updated in the thread. This is safe because `State` reads
+    every property from the backend immediately after updating it. Each thread
+    has its own backends, because another thread could update a shared backend
+    between the update and the reads.
+    """
+    try:
+        backends = _THREAD_BACKENDS.backends
+    except AttributeError:
+        backends = _THREAD_BACKENDS.backends = {}
+    key = (substance, backend)
+    if key not in backends:
+        backends[key] = CoolProp.AbstractState(backend, substance)
+    return backends[key]
+
+
+@functools.lru_cache(maxsize=4096)
+def _flash(
+    substance: str, backend: str, inputs: int, value_1: float, value_2: float
+) -> tuple:
+    """Update a backend and return the SI values of the `_OUTPUT_KEYS` properties.
+
+    CoolProp is deterministic, so the results are cached by the substance, the
+    backend name, and the exact input values, and States set to the same inputs
+    share one flash. The update and the reads use the backend of the calling
+    thread, so they can't be interleaved with another thread's update and only
+    consistent outputs are cached. Pairs that a tabular backend doesn't support
+    are computed with the HEOS backend for the same substance. The specific
+    volume is returned instead of the density, ``None`` is returned for the
+    quality of single-phase states, and the phase is returned as its name.
+    """
+    abstract_state = _get_backend(substance, backend)
+    try:
+        abstract_state.update(inputs, value_1, value_2)
+    except ValueError as e:
+        if "not supported for Tabular backend" not in str(e):
+            raise
+        abstract_state = _get_backend(substance, "HEOS")
+        abstract_state.update(inputs, value_1, value_2)
+
+    outputs = {
+        prop: abstract_state.keyed_output(key) for prop, key in _OUTPUT_KEYS.items()
+    }
+    outputs["v"] = 1.0 / outputs["v"]
+    if outputs["x"] == -1.0:
+        outputs["x"] = None
+    outputs["phase"] = CoolPropPhaseNames(outputs["phase"]).name
+    return tuple(outputs.values())
+
+
 class StateError(Exception):
     """Errors associated with setting the `State` object."""
 
@@ -158,20 +274,44 @@ class State(object):
     x : `pint.UnitRegistry.Quantity`
         Quality
 
+    Attributes
+    ----------
+    backend : `str`
+        The CoolProp backend used by `State` instances created after it is set,
+        and by `StateArray` instances when a pair is set.
+        The default, ``"HEOS"``, evaluates the Helmholtz equation of state
+        directly. Set ``State.backend = "BICUBIC&HEOS"`` to interpolate in
+        tables of the equation of state instead, which is faster but less
+        accurate and doesn't detect inputs that aren't independent. The tables
+        are built the first time they are used. Input pairs that the tables
+        don't support are evaluated with ``"HEOS"``.
+
     """
 
-    _allowed_subs = [
-        "AIR",
-        "AMMONIA",
-        "WATER",
-        "PROPANE",
-        "R134A",
-        "R22",
-        "ISOBUTANE",
-        "CARBONDIOXIDE",
-        "OXYGEN",
-        "NITROGEN",
-    ]
+    __slots__ = (
+        "sub",
+        "_label",
+        "_units",
+        "_backend",
+        "_outputs",
+        "_quantities",
+        "_last_inputs",
+    )
+
+    _allowed_subs = frozenset(
+        {
+            "AIR",
+            "AMMONIA",
+            "WATER",
+            "PROPANE",
+            "R134A",
+            "R22",
+            "ISOBUTANE",
+            "CARBONDIOXIDE",
+            "OXYGEN",
+            "NITROGEN",
+        }
+    )
 
     _all_pairs = set(
         munge_coolprop_input_prop(k)
@@ -183,11 +323,13 @@ class State(object):
     _unsupported_pairs = {"Tu", "Th", "us", "hx"}
     _unsupported_pairs.update([k[::-1] for k in _unsupported_pairs])
 
-    _allowed_pairs = _all_pairs - _unsupported_pairs
+    _allowed_pairs = frozenset(_all_pairs - _unsupported_pairs)
+
+    _all_props = frozenset("Tpvuhsx")
 
-    _all_props = set("Tpvuhsx")
+    _read_only_props = frozenset({"cp", "cv", "phase"})
 
-    _read_only_props = {"cp", "cv", "phase"}
+    backend = "HEOS"
 
     _dimensions = {
         "T": UnitsContainer({"[temperature]": 1.0}),
@@ -235,16 +377,12 @@ class State(object):
     def __getattr__(
         self, key: str
     ) -> "Union[str, tuple[pint.Quantity, pint.Quantity], pint.Quantity]":
-        if key in self._all_props:
-            return object.__getattribute__(self, "_" + key)
+        # The properties are only looked up here when their getter raises an
+        # AttributeError, so the error from _get_property is raised again
+        if key in self._all_props or key in self._read_only_props:
+            return self._get_property(key)
         elif key in self._all_pairs:
-            val_0 = object.__getattribute__(self, "_" + key[0])
-            val_1 = object.__getattribute__(self, "_" + key[1])
-            return val_0, val_1
-        elif key == "phase":
-            return object.__getattribute__(self, "_" + key)
-        elif key in self._read_only_props:
-            return object.__getattribute__(self, "_" + key)
+            return self._get_property(key[0]), self._get_property(key[1])
         else:
             raise AttributeError(f"Unknown attribute {key}")
 
@@ -257,14 +395,20 @@ class State(object):
         """
         if not isinstance(other, State):
             return NotImplemented
-        if (
-            self.sub == other.sub
-            # Pylance does not support NumPy ufuncs
-            and np.isclose(other.T, self.T)  # type: ignore
-            and np.isclose(other.v, self.v)  # type: ignore
-        ):
-            return True
-        return False
+        if self.sub != other.sub:
+            return False
+        # Compare the SI magnitudes, which doesn't need the Quantities or any unit
+        # conversion when the States have different units
+        for prop in "Tv":
+            try:
+                value, other_value = self._outputs[prop], other._outputs[prop]
+            except KeyError:
+                raise AttributeError(
+                    "States can't be compared until a pair of properties is set"
+                ) from None
+            if not math.isclose(value, other_value, rel_tol=1e-5):
+                return False
+        return True
 
     def __le__(self, other: "State"):
         return NotImplemented
@@ -281,33 +425,18 @@ class State(object):
     def __init__(
         self, substance: str, label=None, units=None, **kwargs: "pint.Quantity"
     ):
+        self._outputs = {}
+        self._quantities = {}
+        self._last_inputs = None
+
         if units is None:
             units = default_units
         self.units = units
 
         self.label = label
 
-        if substance.upper() in self._allowed_subs:
-            self.sub = substance.upper()
-        else:
-            raise ValueError(
-                f"{substance} is not an allowed substance. "
-                f"Choose one of {self._allowed_subs}."
-            )
-
-        self._abstract_state = CoolProp.AbstractState("HEOS", self.sub)
-
-        input_props = ""
-        for arg in kwargs:
-            if arg not in self._all_props:
-                raise ValueError(f"The argument {arg} is not allowed.")
-            else:
-                input_props += arg
-
-        if len(input_props) > 2 or len(input_props) == 1:
-            raise ValueError(
-                "Incorrect number of properties specified. Must be 2 or 0."
-            )
+        self.sub = self._check_substance(substance)
+        input_props = self._get_input_props(kwargs)
 
         if len(input_props) > 0 and input_props not in self._allowed_pairs:
             raise StateError(
@@ -315,8 +444,15 @@ class State(object):
                 "yet. Sorry!"
             )
 
+        # The backend is looked up by name for each update, since the State may be
+        # updated from a different thread than the one that created it
+        self._backend = self.backend
+
         if len(input_props) > 0:
-            setattr(self, input_props, (kwargs[input_props[0]], kwargs[input_props[1]]))
+            values = (kwargs[input_props[0]], kwargs[input_props[1]])
+            self._check_dimensions(input_props, values)
+            self._check_values(input_props, values)
+            self._set_properties(input_props, values)
 
     @property
     def label(self):
@@ -343,72 +479,168 @@ class State(object):
 
     @units.setter
     def units(self, value: str | None):
-        if value is None or value in ("EE", "SI"):
-            self._units = value
-            if hasattr(self, "T"):
-                setattr(self, "Tv", (self.T, self.v))
-        else:
-            raise TypeError(
-                f"The given units '{units!r}' are not supported. Must be 'SI', "
-                "'EE', or None."
-            )
+        self._check_units(value)
+        self._units = value
+        self._quantities = {}
+
+    @classmethod
+    def from_arrays(
+        cls,
+        substance: str,
+        pair: str,
+        values_1: "pint.Quantity",
+        values_2: "pint.Quantity",
+        units: str | None = None,
+    ) -> "StateArray":
+        """Compute the properties of many states of one substance at once.
+
+        With the default backend, every property of every point is computed with
+        one call to `CoolProp.CoolProp.PropsSImulti`, which flashes each point
+        once, so the loop over the points runs inside CoolProp instead of in
+        Python. With other backends set in `State.backend`, the points are
+        flashed separately.
+
+        Parameters
+        ----------
+        substance : `str`
+            One of the substances supported by CoolProp
+        pair : `str`
+            The pair of input properties, for example ``"ph"``
+        values_1 : `pint.UnitRegistry.Quantity`
+            Array of values of the first property in ``pair``
+        values_2 : `pint.UnitRegistry.Quantity`
+            Array of values of the second property in ``pair``, broadcastable
+            with ``values_1``
+        units : `str`, optional
+            The units of the output properties, ``"SI"``, ``"EE"``, or `None`.
+            Defaults to the default units.
+
+        Returns
+        -------
+        `StateArray`
+            The states at each of the points
+
+        """
+        states = StateArray(substance, units=units)
+        setattr(states, pair, (values_1, values_2))
+        return states
+
+    def _vector(self) -> np.ndarray:
+        """Pack the properties into an array of floats in SI units.
+
+        The order of the properties is ``T``, ``p``, ``u``, ``s``, ``v``, ``h``,
+        ``x``. The quality is NaN when it is not defined for this state.
+        """
+        values = [self._outputs[prop] for prop in "Tpusvhx"]
+        return np.array([np.nan if value is None else value for value in values])
+
+    def _get_property(self, key: str) -> "Union[str, pint.Quantity, None]":
+        """Get a property of the state in the units of this `State`.
+
+        The `~pint.UnitRegistry.Quantity` for each property is only constructed
+        the first time the property is read after the state or the units change.
+        """
+        quantities = self._quantities
+        if key not in quantities:
+            try:
+                value = self._outputs[key]
+            except KeyError:
+                raise AttributeError(
+                    f"The property {key} is not available until a pair of "
+                    "properties is set"
+                ) from None
+            if value is not None and key != "phase":
+                value = _from_SI(key, value, self.units)
+            quantities[key] = value
+        return quantities[key]
 
     def to_SI(self, prop: str, value: "pint.Quantity") -> "pint.Quantity":
         """Convert the input ``value`` to the appropriate SI base units."""
-        return value.to(self._SI_units[prop])
+        return value.to(_SI_UNITS[prop])
 
     def to_PropsSI(self, prop: str, value: "pint.Quantity") -> float:  # noqa: D403
         """CoolProp can't handle Pint Quantites so return the magnitude only.
 
         Convert to the appropriate SI units first.
         """  # noqa: D403
-        return self.to_SI(prop, value).magnitude
+        conversion = _TO_SI.get((prop, value.units))
+        if conversion is not None:
+            si_factor, factor, offset = conversion
+            return (value.magnitude - offset) * factor / si_factor
+        return value.m_as(_SI_UNITS[prop])
+
+    @classmethod
+    def _check_substance(cls, substance: str) -> str:
+        """Return the name of ``substance`` used by CoolProp, if it is supported."""
+        if substance.upper() not in cls._allowed_subs:
+            raise ValueError(
+                f"{substance} is not an allowed substance. "
+                f"Choose one of {sorted(cls._allowed_subs)}."
+            )
+        return substance.upper()
+
+    @classmethod
+    def _get_input_props(cls, kwargs: "dict[str, pint.Quantity]") -> str:
+        """Return the pair of input properties in ``kwargs``, or ``""`` if empty."""
+        for arg in kwargs:
+            if arg not in cls._all_props:
+                raise ValueError(f"The argument {arg} is not allowed.")
+        input_props = "".join(kwargs)
+
+        if len(input_props) > 2 or len(input_props) == 1:
+            raise ValueError(
+                "Incorrect number of properties specified. Must be 2 or 0."
+            )
+        return input_props
+
+    @staticmethod
+    def _check_units(units: str | None) -> None:
+        if units is not None and units not in ("SI", "EE"):
+            raise TypeError(
+                f"The given units {units!r} are not supported. Must be 'SI', "
+                "'EE', or None."
+            )
 
     @staticmethod
     def _check_values(
         properties: str, values: "tuple[pint.Quantity, pint.Quantity]"
     ) -> None:
         for p, v in zip(properties, values):
-            if p in "Tvp" and v.to_base_units().magnitude < 0.0:
+            magnitude = v.to_base_units().magnitude
+            if p in "Tvp" and np.any(magnitude < 0.0):
                 raise StateError(f"The value of {p} must be positive in absolute units")
-            elif p == "x" and not (0.0 <= v.to_base_units().magnitude <= 1.0):
+            elif p == "x" and not np.all((0.0 <= magnitude) & (magnitude <= 1.0)):
                 raise StateError("The value of the quality must be between 0 and 1")
 
+    @classmethod
     def _check_dimensions(
-        self, properties: str, values: "tuple[pint.Quantity, pint.Quantity]"
+        cls, properties: str, values: "tuple[pint.Quantity, pint.Quantity]"
     ) -> None:
         for p, v in zip(properties, values):
-            # Dimensionless values are a special case and don't work with
-            # the "check" method.
-            try:
-                valid = v.check(self._SI_units[p])
-            except KeyError:
-                valid = v.dimensionality == self._dimensions[p]
-            if not valid:
-                raise StateError(
-                    f"The dimensions for {p} must be {self._dimensions[p]}"
-                )
+            # Compare with the precomputed dimensions, which is faster than
+            # parsing the SI units with the "check" method
+            if v.dimensionality != cls._dimensions[p]:
+                raise StateError(f"The dimensions for {p} must be {cls._dimensions[p]}")
 
     def _set_properties(
         self, known_props: str, known_values: "tuple[pint.Quantity, pint.Quantity]"
     ) -> None:
-        known_state: OrderedDict[str, float] = OrderedDict()
-
+        inputs, swap = _INPUT_PAIRS[known_props]
+        known_state = []
         for prop, val in zip(known_props, known_values):
-            if prop == "x":
-                known_state["Q"] = self.to_PropsSI(prop, val)
-            elif prop == "v":
-                known_state["Dmass"] = 1.0 / self.to_PropsSI(prop, val)
-            else:
-                postfix = "" if prop in ["T", "p"] else "mass"
-                known_state[prop.upper() + postfix] = self.to_PropsSI(prop, val)
-
-        for key in sorted(known_state):
-            known_state.move_to_end(key)
+            value = float(self.to_PropsSI(prop, val))
+            known_state.append(1.0 / value if prop == "v" else value)
+        if swap:
+            known_state.reverse()
+
+        # CoolProp is deterministic, so the outputs for the same inputs as the
+        # last update are the ones that are already stored
+        last_inputs = (inputs, *known_state)
+        if last_inputs == self._last_inputs:
+            return
 
-        inputs = getattr(CoolProp, "".join(known_state.keys()) + "_INPUTS")
         try:
-            self._abstract_state.update(inputs, *known_state.values())
+            outputs = _flash(self.sub, self._backend, *last_inputs)
         except ValueError as e:
             if "Saturation pressure" in str(e):
                 raise StateError(
@@ -418,32 +650,262 @@ class State(object):
             else:
                 raise
 
-        for prop in self._all_props.union(self._read_only_props):
+        self._outputs = dict(zip(_OUTPUT_KEYS, outputs))
+        self._quantities = {}
+        self._last_inputs = last_inputs
+
+
+def _state_property(key: str) -> property:
+    """Return a read-only property that gets ``key`` with `State._get_property`."""
+
+    def getter(self: State) -> "Union[str, pint.Quantity, None]":
+        return self._get_property(key)
+
+    return property(getter)
+
+
+# Properties are found by the normal attribute lookup, which is much faster than
+# falling back to __getattr__ on every read
+for _prop in _OUTPUT_KEYS:
+    setattr(State, _prop, _state_property(_prop))
+del _prop
+
+
+# The SI units of each property, parsed once so conversions skip the unit parser
+_SI_UNITS = {prop: units.Unit(unit) for prop, unit in State._SI_units.items()}
+
+
+def _build_unit_conversions() -> "dict[tuple[str | None, str], tuple]":
+    """Find the conversions from SI base units to the units of each system.
+
+    The conversions are keyed by the unit system and the property. Each one is
+    the unit of the property in the system, the factors of the SI units and of
+    that unit to the root units, and the offset between them. The factors are
+    kept separate so that conversions divide by the factor of the target unit,
+    as pint does, rather than multiplying by its reciprocal.
+    """
+    conversions = {}
+    for system in (None, "SI", "EE"):
+        for prop, si_units in State._SI_units.items():
+            unit = units.Unit(UNITS.get((system, prop), si_units))
+            si_factor = units.get_root_units(si_units)[0]
+            factor = units.get_root_units(unit)[0]
+            offset = Q_(0.0, si_units).m_as(unit)
+            conversions[system, prop] = (unit, si_factor, factor, offset)
+    return conversions
+
+
+_UNIT_CONVERSIONS = _build_unit_conversions()
+
+# The factors and offset of each unit in `_UNIT_CONVERSIONS`, keyed by the property and
+# the unit, so inputs in those units are converted to SI without pint
+_TO_SI = {
+    (prop, unit): (si_factor, factor, offset)
+    for (_, prop), (unit, si_factor, factor, offset) in _UNIT_CONVERSIONS.items()
+}
+
+
+def _from_SI(
+    prop: str, magnitude: "Union[float, np.ndarray]", system: str | None
+) -> "pint.Quantity":
+    """Convert a magnitude of ``prop`` in SI base units to the units of ``system``.
+
+    This applies the factors and offset from `_UNIT_CONVERSIONS` directly to the
+    magnitude, rather than asking pint to convert a Quantity.
+    """
+    unit, si_factor, factor, offset = _UNIT_CONVERSIONS[system, prop]
+    return Q_(magnitude * si_factor / factor + offset, unit)
+
+
+class StateArray(object):
+    """Manager for arrays of thermodynamic states of one substance.
+
+    The properties are stored as one array of floats in SI units per property,
+    and are only wrapped in a `pint.UnitRegistry.Quantity` when they are read.
+    Setting a pair of properties computes every property of every point with
+    one call to `CoolProp.CoolProp.PropsSImulti`, which flashes each point once.
+    Other backends than ``"HEOS"`` can't be used by PropsSImulti, so with them
+    each point is flashed separately with the backend set in `State.backend`.
+
+    Parameters
+    ----------
+    substance : `str`
+        One of the substances supported by CoolProp
+    units : `str`, optional
+        The units of the properties, ``"SI"``, ``"EE"``, or `None`. Defaults to
+        the default units.
+    kwargs : `pint.UnitRegistry.Quantity`
+        Arrays of the values of two of the input properties of `State`,
+        broadcastable with each other
+
+    Notes
+    -----
+    Points that CoolProp can't solve have NaN for every property and a phase
+    of ``"unknown"``. The quality is NaN for points where it is not defined.
+
+    """
+
+    __slots__ = (
+        "sub",
+        "_units",
+        "_T",
+        "_p",
+        "_u",
+        "_s",
+        "_v",
+        "_h",
+        "_x",
+        "_cp",
+        "_cv",
+        "_phase",
+    )
+
+    def __init__(self, substance: str, units=None, **kwargs: "pint.Quantity"):
+        if units is None:
+            units = default_units
+        self.units = units
+
+        self.sub = State._check_substance(substance)
+        input_props = State._get_input_props(kwargs)
+
+        if len(input_props) > 0:
+            setattr(self, input_props, (kwargs[input_props[0]], kwargs[input_props[1]]))
+
+    def __setattr__(
+        self, key: str, value: "Union[str, tuple[pint.Quantity, pint.Quantity]]"
+    ) -> None:
+        if key.startswith("_") or key in ("sub", "units"):
+            object.__setattr__(self, key, value)
+        elif key in State._allowed_pairs:
+            if not isinstance(value, tuple):  # pragma: no cover, for typing
+                raise ValueError("Must pass a tuple of Quantities")
+            State._check_dimensions(key, value)
+            State._check_values(key, value)
+            self._set_properties(key, value)
+        elif key in State._all_pairs:
+            raise StateError(
+                f"The pair of input properties entered ({key}) isn't supported yet. "
+                "Sorry!"
+            )
+        else:
+            raise AttributeError(f"Unknown attribute {key}")
+
+    def __getattr__(
+        self, key: str
+    ) -> "Union[np.ndarray, tuple[pint.Quantity, pint.Quantity], pint.Quantity]":
+        if key in State._all_pairs:
+            return getattr(self, key[0]), getattr(self, key[1])
+        elif key == "phase":
+            codes = self._get_array("phase")
+            names = np.full(codes.shape, CoolPropPhaseNames.unknown.name, dtype=object)
+            for phase in CoolPropPhaseNames:
+                names[codes == phase.value] = phase.name
+            return names
+        elif key in State._all_props or key in State._read_only_props:
+            return _from_SI(key, self._get_array(key), self.units)
+        else:
+            raise AttributeError(f"Unknown attribute {key}")
+
+    def __len__(self) -> int:
+        """Return the number of states, which is 0 until a pair is set.
+
+        Every point of the arrays is a state, so scalar inputs give one state.
+        """
+        try:
+            return object.__getattribute__(self, "_T").size
+        except AttributeError:
+            return 0
+
+    def _get_array(self, key: str) -> np.ndarray:
+        """Get the array of SI values of ``key``, if a pair has been set."""
+        try:
+            return object.__getattribute__(self, "_" + key)
+        except AttributeError:
+            raise AttributeError(
+                f"The property {key} is not available until a pair of properties is "
+                "set"
+            ) from None
+
+    @property
+    def units(self):
+        """Get or set the string units of the properties."""
+        return self._units
+
+    @units.setter
+    def units(self, value: str | None):
+        State._check_units(value)
+        self._units = value
+
+    def _set_properties(
+        self, known_props: str, known_values: "tuple[pint.Quantity, pint.Quantity]"
+    ) -> None:
+        inputs = []
+        for prop, val in zip(known_props, known_values):
+            value = np.asarray(val.m_as(_SI_UNITS[prop]), dtype=float)
+            inputs.append(1.0 / value if prop == "v" else value)
+        shape = np.broadcast_shapes(*(np.shape(i) for i in inputs))
+        input_1, input_2 = (np.broadcast_to(i, shape).ravel() for i in inputs)
+
+        backend = State.backend
+        if backend == "HEOS":
+            outputs = self._props_si_multi(known_props, input_1, input_2)
+        else:
+            outputs = self._flash_points(known_props, input_1, input_2, backend)
+
+        for prop, output in zip(_PROPSSI_OUTPUTS, outputs.T):
+            output = np.reshape(output, shape)
             if prop == "v":
-                v = 1.0 / self._abstract_state.keyed_output(CoolProp.iDmass)
-                value = v * units(self._SI_units[prop])
+                output = 1.0 / output
             elif prop == "x":
-                x = self._abstract_state.keyed_output(CoolProp.iQ)
-                if x == -1.0:
-                    value = None
-                else:
-                    value = x * units(self._SI_units[prop])
-            elif prop == "phase":
-                value = CoolPropPhaseNames(
-                    self._abstract_state.keyed_output(CoolProp.iPhase)
-                ).name
-            else:
-                postfix = "" if prop in "Tp" else "mass"
-                p = getattr(CoolProp, "i" + prop.title() + postfix)
-                value = self._abstract_state.keyed_output(p) * units(
-                    self._SI_units[prop]
-                )
+                output[output == -1.0] = np.nan
+            setattr(self, "_" + prop, output)
+
+    def _props_si_multi(
+        self, known_props: str, input_1: np.ndarray, input_2: np.ndarray
+    ) -> np.ndarray:
+        """Compute every property of every point with one call to PropsSImulti.
+
+        One flash per point gives every output, so the result has one row per
+        point and one column per property, in the order of `_PROPSSI_OUTPUTS`.
+        """
+        outputs = CoolProp.CoolProp.PropsSImulti(
+            list(_PROPSSI_OUTPUTS.values()),
+            _COOLPROP_INPUT_NAMES[known_props[0]],
+            input_1,
+            _COOLPROP_INPUT_NAMES[known_props[1]],
+            input_2,
+            "HEOS",
+            [self.sub],
+            [1.0],
+        )
+        outputs = np.reshape(
+            np.asarray(outputs, dtype=float), (-1, len(_PROPSSI_OUTPUTS))
+        )
+        return np.where(np.isfinite(outputs), outputs, np.nan)
+
+    def _flash_points(
+        self, known_props: str, input_1: np.ndarray, input_2: np.ndarray, backend: str
+    ) -> np.ndarray:
+        """Compute every property of every point with `_flash`, one point at a time.
 
-            set_units = None
-            if self.units == "SI":
-                set_units = getattr(default_SI, prop, None)
-            elif self.units == "EE":
-                set_units = getattr(default_EE, prop, None)
-            if set_units is not None:
-                value.ito(set_units)
-            setattr(self, "_" + prop, value)
+        Tabular backends can't be used by PropsSImulti, so the points are flashed
+        with the low-level interface instead, which also computes the pairs that
+        a tabular backend doesn't support with HEOS. The result has the same
+        layout as `_props_si_multi`.
+        """
+        inputs, swap = _INPUT_PAIRS[known_props]
+        outputs = np.full((input_1.size, len(_OUTPUT_KEYS)), np.nan)
+        for i, values in enumerate(zip(input_1.tolist(), input_2.tolist())):
+            if swap:
+                values = values[::-1]
+            try:
+                point = dict(
+                    zip(_OUTPUT_KEYS, _flash(self.sub, backend, inputs, *values))
+                )
+            except ValueError:
+                continue
+            point["v"] = 1.0 / point["v"]
+            point["x"] = -1.0 if point["x"] is None else point["x"]
+            point["phase"] = CoolPropPhaseNames[point["phase"]].value
+            outputs[i] = list(point.values())
+        return outputs
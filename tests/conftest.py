@@ -0,0 +1,71 @@
+"""Shared fixtures for the ThermoState test suite."""
+from functools import lru_cache
+
+import pytest
+
+from thermostate import Q_, State
+
+
+def pytest_addoption(parser):
+    """Add the option to run the slow tests."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run the slow tests"
+    )
+
+
+def pytest_configure(config):
+    """Register the marker for slow tests."""
+    config.addinivalue_line("markers", "slow: mark a test as slow to run")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the slow tests unless ``--runslow`` is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def water():
+    """Provide one water `State` for the whole session.
+
+    Tests must set a property pair before reading any properties from the
+    shared `State`, and should construct their own `State` if they need to
+    modify anything other than the thermodynamic state.
+    """
+    return State("water")
+
+
+@lru_cache(maxsize=64)
+def _built(substance, items):
+    return State(substance, **dict(items))
+
+
+def _build_state(substance, **kwargs):
+    """Return a `State` built from ``kwargs``, shared by equivalent requests.
+
+    The input properties are sorted before the cache lookup, so ``T`` and ``p``
+    give the same `State` as ``p`` and ``T``. The returned `State` is shared
+    and must not be modified by the tests. Tests that need to set a new pair
+    or change the units should modify a `copy.copy` of it instead.
+    """
+    return _built(substance.lower(), tuple(sorted(kwargs.items())))
+
+
+@pytest.fixture(scope="session")
+def build_state():
+    """Return the cached `State` builder for states used only for comparisons."""
+    return _build_state
+
+
+@pytest.fixture(scope="session")
+def ref_gas_state(build_state):
+    """Provide water vapor at 400 K and 1 atm, flashed once for the whole session.
+
+    Tests compare freshly built states against this reference with ``==``
+    instead of constructing a second `State` for the comparison.
+    """
+    return build_state("water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
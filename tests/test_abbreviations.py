@@ -1,6 +1,7 @@
 """Test module for the units abbreviations code."""
 from thermostate import EnglishEngineering as EE
 from thermostate import SystemInternational as SI
+from thermostate.abbreviations import UNITS
 
 
 def test_EE():
@@ -21,3 +22,11 @@ def test_SI():
     assert SI.u == "kJ/kg"
     assert SI.v == "m**3/kg"
     assert SI.p == "bar"
+
+
+def test_UNITS():
+    """Test the lookup of the abbreviations by unit system and property."""
+    for system, abbreviations in (("EE", EE), ("SI", SI)):
+        for prop in ("s", "h", "T", "u", "v", "p", "cp", "cv"):
+            assert UNITS[system, prop] == getattr(abbreviations, prop)
+    assert len(UNITS) == 16
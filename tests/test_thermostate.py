@@ -1,45 +1,428 @@
 """Test module for the main ThermoState code."""
+import copy
+import math
+import sys
+import threading
+
+import CoolProp
 import numpy as np
 import pytest
 
-from thermostate import Q_, State, set_default_units
-from thermostate.thermostate import StateError
+from thermostate import Q_, State, StateArray, set_default_units, units
+from thermostate.abbreviations import UNITS
+from thermostate.thermostate import StateError, _flash, _get_backend
+
+# Unit objects resolved once, so building Quantities skips the unit parser
+K = units.kelvin
+DEG_C = units.degC
+PA = units.pascal
+ATM = units.atm
+J_KG = units.joule / units.kilogram
+KJ_KG = units.kilojoule / units.kilogram
+J_KG_K = units.joule / (units.kilogram * units.kelvin)
+M3_KG = units.meter**3 / units.kilogram
+DIMLESS = units.dimensionless
+PERCENT = units.percent
+
+# Input values shared by several tests, built once at import
+T300 = Q_(300.0, K)
+T400 = Q_(400.0, K)
+P_ATM = Q_(101325.0, PA)
+T_BOIL = Q_(100, DEG_C)
+ONE_ATM = Q_(1.0, ATM)
+T_ARRAY = Q_(np.array([300.0, 400.0]), K)
+
+# Superheated water vapor at 400 K and atmospheric pressure
+U_GAS = Q_(2547715.3635084038, J_KG)
+S_GAS = Q_(7496.2021523754065, J_KG_K)
+V_GAS = Q_(1.801983936953226, M3_KG)
+H_GAS = Q_(2730301.3859201893, J_KG)
+
+# Two-phase water at 400 K with a quality of 0.5
+X_HALF = Q_(0.5, DIMLESS)
+X_HALF_PCT = Q_(50, PERCENT)
+H_TWOPHASE = Q_(1624328.2430353598, J_KG)
+
+# Two-phase water at atmospheric pressure
+U_SAT = Q_(1013250.0, J_KG)
+S_SAT = Q_(3028.9867985920914, J_KG_K)
+V_SAT = Q_(0.4772010021515822, M3_KG)
+H_SAT = Q_(1061602.391543017, J_KG)
+X_SAT = Q_(0.28475636946248034, DIMLESS)
+
+# Superheated water vapor at atmospheric pressure
+U_SH = Q_(3013250.0, J_KG)
+S_SH = Q_(8623.283568815832, J_KG_K)
+V_SH = Q_(3.189303132125469, M3_KG)
+H_SH = Q_(3336406.139862406, J_KG)
+
+# Every property of a State that has units
+ALL_UNIT_PROPS = frozenset(State._all_props | State._read_only_props) - {"phase"}
+
+# Units used to strip the magnitudes of the properties before comparing them
+BASE_UNITS = {
+    "T": K,
+    "p": PA,
+    "u": J_KG,
+    "s": J_KG_K,
+    "v": M3_KG,
+    "h": J_KG,
+    "x": DIMLESS,
+    "cp": J_KG_K,
+    "cv": J_KG_K,
+}
+
+# Two-phase water at atmospheric pressure
+EXPECTED_SAT = {
+    "T": Q_(373.1242958476843, K),
+    "p": P_ATM,
+    "u": U_SAT,
+    "s": S_SAT,
+    "v": V_SAT,
+    "h": H_SAT,
+    "x": X_SAT,
+}
+
+# Superheated water vapor at atmospheric pressure
+EXPECTED_SUPERHEATED = {
+    "T": Q_(700.9882316847855, K),
+    "p": P_ATM,
+    "u": U_SH,
+    "s": S_SH,
+    "v": V_SH,
+    "h": H_SH,
+}
+
+# Superheated water vapor at 400 K and atmospheric pressure
+EXPECTED_GAS = {
+    "T": T400,
+    "p": P_ATM,
+    "u": U_GAS,
+    "s": S_GAS,
+    "cp": Q_(2009.2902478486988, J_KG_K),
+    "cv": Q_(1509.1482452129906, J_KG_K),
+    "v": V_GAS,
+    "h": H_GAS,
+    "phase": "gas",
+}
+
+# Two-phase water at 400 K with a quality of 0.5
+EXPECTED_TWOPHASE = {
+    "T": T400,
+    "p": Q_(245769.34557103913, PA),
+    "u": Q_(1534461.5163075812, J_KG),
+    "s": Q_(4329.703956664546, J_KG_K),
+    "cp": Q_(4056.471547685226, J_KG_K),
+    "cv": Q_(2913.7307270395363, J_KG_K),
+    "v": Q_(0.3656547423394701, M3_KG),
+    "h": H_TWOPHASE,
+    "x": X_HALF,
+}
+
+# Each case is the input pair, the values to set, and the expected properties
+SETTER_CASES = [
+    pytest.param("Tp", (T400, P_ATM), EXPECTED_GAS, id="Tp"),
+    pytest.param("pT", (P_ATM, T400), EXPECTED_GAS, id="pT"),
+    pytest.param("sT", (S_GAS, T400), EXPECTED_GAS, id="sT"),
+    pytest.param("Ts", (T400, S_GAS), EXPECTED_GAS, id="Ts"),
+    pytest.param("vT", (V_GAS, T400), EXPECTED_GAS, id="vT"),
+    pytest.param("Tv", (T400, V_GAS), EXPECTED_GAS, id="Tv"),
+    pytest.param("xT", (X_HALF, T400), EXPECTED_TWOPHASE, id="xT"),
+    pytest.param("xT", (X_HALF_PCT, T400), EXPECTED_TWOPHASE, id="xT-percent"),
+    pytest.param("Tx", (T400, X_HALF), EXPECTED_TWOPHASE, id="Tx"),
+    pytest.param("pu", (P_ATM, U_SAT), EXPECTED_SAT, id="pu-twophase"),
+    pytest.param("pu", (P_ATM, U_SH), EXPECTED_SUPERHEATED, id="pu-superheated"),
+    pytest.param("up", (U_SAT, P_ATM), EXPECTED_SAT, id="up-twophase"),
+    pytest.param("up", (U_SH, P_ATM), EXPECTED_SUPERHEATED, id="up-superheated"),
+    pytest.param("ps", (P_ATM, S_SAT), EXPECTED_SAT, id="ps-twophase"),
+    pytest.param("ps", (P_ATM, S_SH), EXPECTED_SUPERHEATED, id="ps-superheated"),
+    pytest.param("sp", (S_SAT, P_ATM), EXPECTED_SAT, id="sp-twophase"),
+    pytest.param("sp", (S_SH, P_ATM), EXPECTED_SUPERHEATED, id="sp-superheated"),
+    pytest.param("pv", (P_ATM, V_SAT), EXPECTED_SAT, id="pv-twophase"),
+    pytest.param("pv", (P_ATM, V_SH), EXPECTED_SUPERHEATED, id="pv-superheated"),
+    pytest.param("vp", (V_SAT, P_ATM), EXPECTED_SAT, id="vp-twophase"),
+    pytest.param("vp", (V_SH, P_ATM), EXPECTED_SUPERHEATED, id="vp-superheated"),
+    pytest.param("ph", (P_ATM, H_SAT), EXPECTED_SAT, id="ph-twophase"),
+    pytest.param("ph", (P_ATM, H_SH), EXPECTED_SUPERHEATED, id="ph-superheated"),
+    pytest.param("hp", (H_SAT, P_ATM), EXPECTED_SAT, id="hp-twophase"),
+    pytest.param("hp", (H_SH, P_ATM), EXPECTED_SUPERHEATED, id="hp-superheated"),
+    pytest.param("px", (P_ATM, X_SAT), EXPECTED_SAT, id="px"),
+    pytest.param("xp", (X_SAT, P_ATM), EXPECTED_SAT, id="xp"),
+    pytest.param("uv", (U_SAT, V_SAT), EXPECTED_SAT, id="uv"),
+    pytest.param("vu", (V_SAT, U_SAT), EXPECTED_SAT, id="vu"),
+    pytest.param("sv", (S_SAT, V_SAT), EXPECTED_SAT, id="sv"),
+    pytest.param("vs", (V_SAT, S_SAT), EXPECTED_SAT, id="vs"),
+    pytest.param("sh", (S_SAT, H_SAT), EXPECTED_SAT, id="sh"),
+    pytest.param("hs", (H_SAT, S_SAT), EXPECTED_SAT, id="hs"),
+    pytest.param("vh", (V_SAT, H_SAT), EXPECTED_SAT, id="vh"),
+    pytest.param("hv", (H_SAT, V_SAT), EXPECTED_SAT, id="hv"),
+]
+
+# Input pairs that State does not support, with the values to try to set
+UNSUPPORTED_PAIRS = [
+    # These pairs fail because T and u are not valid inputs for PhaseSI
+    # in CoolProp 6.1.0
+    ("uT", (U_GAS, T400)),
+    ("Tu", (T400, U_GAS)),
+    # These pairs fail because T and h are not valid inputs for PhaseSI
+    # in CoolProp 6.1.0
+    ("hT", (H_GAS, T400)),
+    ("Th", (T400, H_GAS)),
+    # These pairs fail because x and h are not valid inputs for PhaseSI
+    # in CoolProp 6.3.0
+    ("xh", (X_HALF, H_TWOPHASE)),
+    ("hx", (H_TWOPHASE, X_HALF)),
+    # These pairs fail because s and u are not valid inputs for PhaseSI
+    # in CoolProp 6.1.0
+    ("us", (U_SAT, S_SAT)),
+    ("su", (S_SAT, U_SAT)),
+]
+
+# Sentinel with the wrong dimensions for every input property except quality
+BAD_DIMENSION = Q_(1.0, DIMLESS)
+V_ONE = Q_(1.0, M3_KG)
+
+# Each case is the input properties, the error that they should raise, and the
+# start of its message
+BAD_INPUTS = [
+    # Negative absolute temperatures, pressures, and specific volumes
+    pytest.param(
+        {"T": Q_(-100, K), "p": P_ATM},
+        StateError,
+        "must be positive",
+        id="negative-T",
+    ),
+    pytest.param(
+        {"T": T300, "p": Q_(-101325, PA)},
+        StateError,
+        "must be positive",
+        id="negative-p",
+    ),
+    pytest.param(
+        {"T": T300, "v": Q_(-10.13, M3_KG)},
+        StateError,
+        "must be positive",
+        id="negative-v",
+    ),
+    # Vapor qualities outside of 0.0 to 1.0
+    pytest.param(
+        {"x": Q_(-1.0, DIMLESS), "p": P_ATM},
+        StateError,
+        "quality must be between 0 and 1",
+        id="x-lt-0",
+    ),
+    pytest.param(
+        {"x": Q_(2.0, DIMLESS), "p": P_ATM},
+        StateError,
+        "quality must be between 0 and 1",
+        id="x-gt-1",
+    ),
+    # Bad dimensions for each input property. Quality uses a temperature because
+    # "dimensionless" is actually the correct dimension for quality.
+    pytest.param(
+        {"T": BAD_DIMENSION, "v": V_ONE},
+        StateError,
+        "The dimensions for T",
+        id="T-dimensions",
+    ),
+    pytest.param(
+        {"p": BAD_DIMENSION, "v": V_ONE},
+        StateError,
+        "The dimensions for p",
+        id="p-dimensions",
+    ),
+    pytest.param(
+        {"v": BAD_DIMENSION, "T": T300},
+        StateError,
+        "The dimensions for v",
+        id="v-dimensions",
+    ),
+    pytest.param(
+        {"u": BAD_DIMENSION, "v": V_ONE},
+        StateError,
+        "The dimensions for u",
+        id="u-dimensions",
+    ),
+    pytest.param(
+        {"s": BAD_DIMENSION, "v": V_ONE},
+        StateError,
+        "The dimensions for s",
+        id="s-dimensions",
+    ),
+    pytest.param(
+        {"h": BAD_DIMENSION, "v": V_ONE},
+        StateError,
+        "The dimensions for h",
+        id="h-dimensions",
+    ),
+    pytest.param(
+        {"T": T300, "x": Q_(1.01325, K)},
+        StateError,
+        "The dimensions for x",
+        id="x-dimensions",
+    ),
+    # A two-phase mixture can't be set with T and p
+    pytest.param(
+        {"T": Q_(373.1242958476844, K), "p": P_ATM},
+        StateError,
+        "not independent",
+        id="Tp-twophase",
+    ),
+]
+
+
+def check_state(st, rtol=1e-7, **expected):
+    """Compare all of the expected properties in a single vectorized call.
+
+    ``st`` is either a `State` or a dictionary of properties from `point`.
+    The magnitudes are converted to SI units before they are compared.
+    """
+    get = st.get if isinstance(st, dict) else lambda k: getattr(st, k)
+    expected = dict(expected)
+    if "phase" in expected:
+        assert get("phase") == expected.pop("phase")
+    actual = np.array([get(k).m_as(BASE_UNITS[k]) for k in expected])
+    desired = np.array([v.m_as(BASE_UNITS[k]) for k, v in expected.items()])
+    np.testing.assert_allclose(actual, desired, rtol=rtol)
+
+
+def point(states, i):
+    """Get the properties of one point of a `StateArray` as a dictionary."""
+    return {k: getattr(states, k)[i] for k in ALL_UNIT_PROPS | {"phase"}}
+
+
+def approx_q(q, expected_q, rel=1e-7):
+    """Compare the magnitudes of two Quantities in the units of the expected one.
+
+    The magnitude of ``q`` is only converted if its units are different.
+    """
+    if q.units == expected_q.units:
+        magnitude = q.magnitude
+    else:
+        magnitude = q.m_as(expected_q.units)
+    return math.isclose(magnitude, expected_q.magnitude, rel_tol=rel)
 
 
 class TestState(object):
     """Test the functions of the State object."""
 
-    def test_eq(self):
+    def test_eq(self, ref_gas_state):
         """Test equality comparison of states.
 
         States are equal when their properties are equal and the substances are the
         same.
         """
-        st_1 = State(substance="water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
-        st_2 = State(substance="water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
-        assert st_1 == st_2
+        st = State(substance="water", T=T400, p=P_ATM)
+        assert st == ref_gas_state
+        assert np.array_equal(st._vector(), ref_gas_state._vector(), equal_nan=True)
+
+    def test_eq_units(self, ref_gas_state, build_state):
+        """States in different units are equal when their properties are equal."""
+        st = build_state("water", T=T400, p=P_ATM, units="EE")
+        assert st == ref_gas_state
+        assert ref_gas_state == st
 
-    def test_eq_not_two_states(self):
+    def test_eq_not_set(self, ref_gas_state):
+        """States can't be compared before a pair of properties is set."""
+        with pytest.raises(AttributeError, match="can't be compared"):
+            State("water") == ref_gas_state
+
+    def test_eq_not_two_states(self, water):
         """Test that comparing a state with something else doesn't work."""
-        assert not State(substance="water") == 3
-        assert not 3 == State(substance="water")
+        assert not water == 3
+        assert not 3 == water
 
-    def test_not_eq(self):
+    def test_not_eq(self, ref_gas_state, build_state):
         """States are not equal when properties are not equal."""
-        st_1 = State(substance="water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
-        st_2 = State(substance="water", T=Q_(300.0, "K"), p=Q_(101325.0, "Pa"))
-        assert not st_1 == st_2
+        st = build_state("water", p=P_ATM, T=T300)
+        assert not st == ref_gas_state
+        assert not np.array_equal(st._vector(), ref_gas_state._vector(), equal_nan=True)
 
-    def test_not_eq_sub(self):
+    def test_not_eq_sub(self, ref_gas_state, build_state):
         """States are not equal when substances are not the same."""
-        st_1 = State(substance="water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
-        st_2 = State(substance="ammonia", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
-        assert not st_1 == st_2
-
-    def test_comparison(self):
+        st = build_state("ammonia", T=T400, p=P_ATM)
+        assert not st == ref_gas_state
+
+    def test_shared_backend(self, ref_gas_state):
+        """States of a substance share a backend without sharing properties."""
+        st_1 = State("water", T=T400, p=P_ATM)
+        st_2 = State("water", T=T300, p=P_ATM)
+        assert _get_backend(st_1.sub, st_1._backend) is _get_backend("WATER")
+        assert st_1 == ref_gas_state
+        assert not st_2 == ref_gas_state
+
+    def test_backend_per_thread(self):
+        """Each thread has its own backends."""
+        backends = []
+        thread = threading.Thread(target=lambda: backends.append(_get_backend("WATER")))
+        thread.start()
+        thread.join()
+        assert backends[0] is not _get_backend("WATER")
+
+    def test_states_in_threads(self):
+        """States updated in several threads at once get their own properties."""
+        mismatches = []
+
+        def build_states(offset):
+            for i in range(100):
+                T = Q_(300.0 + offset + 1e-3 * i, K)
+                st = State("water", T=T, p=P_ATM)
+                if not approx_q(st.T, T):
+                    mismatches.append((T, st.T))
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [
+                threading.Thread(target=build_states, args=(offset,))
+                for offset in (0.0, 50.0, 100.0, 150.0)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        assert not mismatches
+
+    @pytest.fixture
+    def tables_dir(self, tmp_path):
+        """Build CoolProp's tables in ``tmp_path`` instead of ``~/.CoolProp``."""
+        key = CoolProp.ALTERNATIVE_TABLES_DIRECTORY
+        previous = CoolProp.CoolProp.get_config_string(key)
+        CoolProp.CoolProp.set_config_string(key, str(tmp_path))
+        yield tmp_path
+        CoolProp.CoolProp.set_config_string(key, previous)
+
+    @pytest.mark.slow
+    def test_tabular_backend(self, monkeypatch, tables_dir):
+        """States can use the tabular backend, with HEOS for unsupported pairs.
+
+        CoolProp builds the tables the first time they are used, which is slow.
+        """
+        monkeypatch.setattr(State, "backend", "BICUBIC&HEOS")
+        s = State("water", T=T400, p=P_ATM)
+        assert _get_backend(s.sub, s._backend).backend_name() == "BicubicBackend"
+        check_state(s, rtol=1e-4, **EXPECTED_GAS)
+        s.uv = U_SAT, V_SAT
+        check_state(s, **EXPECTED_SAT)
+        states = State.from_arrays("water", "uv", U_SAT, V_SAT)
+        check_state(point(states, ()), **EXPECTED_SAT)
+
+    def test_array_backend(self, monkeypatch):
+        """Arrays of states are computed with the backend set on State."""
+        heos = State.from_arrays("water", "Tp", T_ARRAY, P_ATM)
+        monkeypatch.setattr(State, "backend", "SRK")
+        states = State.from_arrays("water", "Tp", T_ARRAY, P_ATM)
+        assert not np.allclose(states.h.m, heos.h.m)
+        for i, T in enumerate(T_ARRAY):
+            s = State("water", T=T, p=P_ATM)
+            expected = {k: getattr(s, k) for k in ALL_UNIT_PROPS - {"x"}}
+            check_state(point(states, i), rtol=1e-14, phase=s.phase, **expected)
+
+    def test_comparison(self, ref_gas_state):
         """Greater/less than comparisons are not supported."""
-        st_1 = State(substance="water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
-        st_2 = State(substance="water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
+        st_1 = st_2 = ref_gas_state
         with pytest.raises(TypeError):
             st_1 < st_2
         with pytest.raises(TypeError):
@@ -51,113 +434,132 @@ class TestState(object):
 
     def test_unit_definitions(self):
         """All of the properties should have units defined."""
-        st = State("water")
-        props = st._all_props.union(st._read_only_props) - {"phase"}  # type: ignore
-        assert all([a in st._SI_units.keys() for a in props])  # type: ignore
-
-    def test_lowercase_input(self):
+        assert ALL_UNIT_PROPS <= State._SI_units.keys()
+
+    @pytest.mark.parametrize(
+        "sub",
+        [
+            "water",
+            "r22",
+            "r134a",
+            "ammonia",
+            "propane",
+            "air",
+            "isobutane",
+            "carbondioxide",
+            "oxygen",
+            "nitrogen",
+        ],
+    )
+    def test_lowercase_input(self, sub):
         """Substances should be able to be specified with lowercase letters."""
-        State(substance="water")
-        State(substance="r22")
-        State(substance="r134a")
-        State(substance="ammonia")
-        State(substance="propane")
-        State(substance="air")
-        State(substance="isobutane")
-        State(substance="carbondioxide")
-        State(substance="oxygen")
-        State(substance="nitrogen")
+        assert State(substance=sub).sub == sub.upper()
 
     def test_bad_substance(self):
         """A substance not in the approved list should raise a ValueError."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="bad substance is not an allowed"):
             State(substance="bad substance")
 
     def test_too_many_props(self):
         """Specifying too many properties should raise a ValueError."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Incorrect number of properties"):
             State(
                 substance="water",
-                T=Q_(300, "K"),
-                p=Q_(101325, "Pa"),
-                u=Q_(100, "kJ/kg"),
+                T=T300,
+                p=P_ATM,
+                u=Q_(100, KJ_KG),
             )
 
     def test_too_few_props(self):
         """Specifying too few properties should raise a value error."""
-        with pytest.raises(ValueError):
-            State(substance="water", T=Q_(300, "K"))
-
-    def test_negative_temperature(self):
-        """Negative absolute temperatures should raise a StateError."""
-        with pytest.raises(StateError):
-            State(substance="water", T=Q_(-100, "K"), p=Q_(101325, "Pa"))
-
-    def test_negative_pressure(self):
-        """Negative absolute pressures should raise a StateError."""
-        with pytest.raises(StateError):
-            State(substance="water", T=Q_(300, "K"), p=Q_(-101325, "Pa"))
-
-    def test_negative_volume(self):
-        """Negative absolute specific volumes should raise a StateError."""
-        with pytest.raises(StateError):
-            State(substance="water", T=Q_(300, "K"), v=Q_(-10.13, "m**3/kg"))
-
-    def test_quality_lt_zero(self):
-        """Vapor qualities less than 0.0 should raise a StateError."""
-        with pytest.raises(StateError):
-            State(substance="water", x=Q_(-1.0, "dimensionless"), p=Q_(101325, "Pa"))
-
-    def test_quality_gt_one(self):
-        """Vapor qualities greater than 1.0 should raise a StateError."""
-        with pytest.raises(StateError):
-            State(substance="water", x=Q_(2.0, "dimensionless"), p=Q_(101325, "Pa"))
+        with pytest.raises(ValueError, match="Incorrect number of properties"):
+            State(substance="water", T=T300)
 
     def test_invalid_input_prop(self):
         """Invalid input properties should raise a ValueError."""
-        with pytest.raises(ValueError):
-            State(
-                substance="water", x=Q_(0.5, "dimensionless"), bad_prop=Q_(101325, "Pa")
-            )
+        with pytest.raises(ValueError, match="The argument bad_prop is not allowed"):
+            State(substance="water", x=X_HALF, bad_prop=P_ATM)
 
-    @pytest.mark.parametrize("prop", ["T", "p", "v", "u", "s", "h"])
-    def test_bad_dimensions(self, prop: str):
-        """Setting bad dimensions for the input property raises a StateError."""
-        kwargs = {prop: Q_(1.0, "dimensionless")}
-        if prop == "v":
-            kwargs["T"] = Q_(300.0, "K")
-        else:
-            kwargs["v"] = Q_(1.0, "m**3/kg")
-        with pytest.raises(StateError):
+    @pytest.mark.parametrize("kwargs, exc, match", BAD_INPUTS)
+    def test_bad_inputs(self, kwargs, exc, match):
+        """Invalid values or dimensions of the input properties raise an error."""
+        with pytest.raises(exc, match=match):
             State(substance="water", **kwargs)
 
-    def test_bad_x_dimensions(self):
-        """Setting bad dimensions for quality raises a StateError.
-
-        Must be done in a separate test because the "dimensionless"
-        sentinel value used in the other test is actually the correct
-        dimension for quality.
-        """
-        with pytest.raises(StateError):
-            State(substance="water", T=Q_(300.0, "K"), x=Q_(1.01325, "K"))
-
-    def test_TP_twophase(self):
-        """Setting a two-phase mixture with T and p should raise a StateError."""
-        with pytest.raises(StateError):
-            State(substance="water", T=Q_(373.1242958476844, "K"), p=Q_(101325.0, "Pa"))
-
-    def test_bad_get_property(self):
+    def test_bad_get_property(self, ref_gas_state):
         """Accessing attributes that aren't one of the properties or pairs raises."""
-        s = State(substance="water", T=Q_(400.0, "K"), p=Q_(101325.0, "Pa"))
-        with pytest.raises(AttributeError):
+        s = ref_gas_state
+        with pytest.raises(AttributeError, match="Unknown attribute bad_get"):
             s.bad_get
 
+    def test_get_property_before_setting(self):
+        """Properties can't be read before a pair of properties is set."""
+        s = State("water")
+        with pytest.raises(AttributeError, match="not available"):
+            s.T
+        assert not hasattr(s, "Tp")
+
+    def test_properties_are_cached(self, ref_gas_state):
+        """Reading a property twice gives the same Quantity until the state changes."""
+        s = copy.copy(ref_gas_state)
+        h = s.h
+        assert s.h is h
+        s.units = "SI"
+        assert s.h is not h
+        assert s.h.units == "kilojoule / kilogram"
+        h = s.h
+        s.Tp = T300, P_ATM
+        assert s.h is not h
+        assert math.isclose(s.T.m_as(K), 300.0)
+        assert ref_gas_state.h is not s.h
+        check_state(ref_gas_state, **EXPECTED_GAS)
+
+    def test_same_inputs_skip_update(self, ref_gas_state):
+        """Setting the same inputs again, in any order or units, keeps the state."""
+        s = copy.copy(ref_gas_state)
+        h = s.h
+        s.pT = ONE_ATM, T400.to(DEG_C)
+        assert s.h is h
+        s.Tp = T300, P_ATM
+        assert s.h is not h
+
+    def test_states_share_flash(self):
+        """States set to the same inputs reuse the cached CoolProp outputs."""
+        st_1 = State("water", T=Q_(412.5, "K"), p=P_ATM)
+        hits = _flash.cache_info().hits
+        st_2 = State("water", p=P_ATM, T=Q_(412.5, "K"))
+        assert _flash.cache_info().hits == hits + 1
+        assert st_1 == st_2
+        assert st_1._outputs is not st_2._outputs
+
+    def test_threads_share_flash(self):
+        """A flash cached in one thread is reused by States in other threads."""
+        T = Q_(437.5, K)
+        states = []
+        thread = threading.Thread(
+            target=lambda: states.append(State("water", T=T, p=P_ATM))
+        )
+        thread.start()
+        thread.join()
+        hits = _flash.cache_info().hits
+        st = State("water", T=T, p=P_ATM)
+        assert _flash.cache_info().hits == hits + 1
+        assert st == states[0]
+        assert approx_q(st.T, T)
+
     def test_bad_property_setting(self):
         """Regression test that pressure is lowercase p, not uppercase."""
         s = State(substance="water")
-        with pytest.raises(AttributeError):
+        with pytest.raises(AttributeError, match="Unknown attribute TP"):
             # Should be lowercase p
-            s.TP = Q_(400.0, "K"), Q_(101325.0, "Pa")
+            s.TP = T400, P_ATM
+
+    def test_no_instance_dict(self):
+        """State uses slots, so other private attributes can't be set."""
+        s = State(substance="water")
+        assert not hasattr(s, "__dict__")
+        with pytest.raises(AttributeError):
+            s._bad = 1
 
     def test_label_cannot_be_converted_to_string(self):
         """Trying to set a label that can't be converted to a string is a TypeError."""
@@ -172,775 +574,82 @@ class TestState(object):
     def test_unsupported_pair(self):
         """Trying to set with an unsupported property pair raises a StateError."""
         with pytest.raises(StateError, match="The pair of input"):
-            State("water", T=Q_(100.0, "degC"), u=Q_(1e6, "J/kg"))
-
-    def test_set_Tp(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.Tp = Q_(400.0, "K"), Q_(101325.0, "Pa")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.Tp[0], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.Tp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-        assert s.phase == "gas"
-
-    def test_set_pT(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.pT = Q_(101325.0, "Pa"), Q_(400.0, "K")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.pT[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-        assert s.phase == "gas"
-
-    # This set of tests fails because T and u are not valid inputs for PhaseSI
-    # in CoolProp 6.1.0
-    @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_uT(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.uT = Q_(2547715.3635084038, "J/kg"), Q_(400.0, "K")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.uT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.uT[0], Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_Tu(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.Tu = Q_(400.0, "K"), Q_(2547715.3635084038, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.Tu[0], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.Tu[1], Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    # This set of tests fails because T and h are not valid inputs for PhaseSI
-    # in CoolProp 6.1.0
-    @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_hT(self):
-        """Set a pair of properties of the State and check the properties.
+            State("water", T=T_BOIL, u=U_SAT)
 
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.hT = Q_(2730301.3859201893, "J/kg"), Q_(400.0, "K")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.hT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.hT[0], Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_Th(self):
+    @pytest.mark.parametrize("pair, inputs, expected", SETTER_CASES)
+    def test_set_pair(self, water, pair, inputs, expected):
         """Set a pair of properties of the State and check the properties.
 
         Also works as a functional/regression test of CoolProp.
         """
-        s = State(substance="water")
-        s.Th = Q_(400.0, "K"), Q_(2730301.3859201893, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.Th[0], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.Th[1], Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    # This set of tests fails because x and h are not valid inputs for PhaseSI
-    # in CoolProp 6.3.0
-    @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_xh(self):
-        """Set a pair of properties of the State and check the properties.
+        setattr(water, pair, inputs)
+        got = getattr(water, pair)
+        assert approx_q(got[0], inputs[0])
+        assert approx_q(got[1], inputs[1])
+        check_state(water, **expected)
+        if "x" not in expected:
+            assert water.x is None
 
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.xh = Q_(0.5, "dimensionless"), Q_(1624328.2430353598, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(245769.34557103913, "Pa"))  # type: ignore
-        assert np.isclose(s.xT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.xT[0], Q_(0.5, "dimensionless"))  # type: ignore
-        assert np.isclose(s.u, Q_(1534461.5163075812, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(4329.703956664546, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(4056.471547685226, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(2913.7307270395363, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.3656547423394701, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1624328.2430353598, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.5, "dimensionless"))  # type: ignore
-
-    # This set of tests fails because x and h are not valid inputs for PhaseSI
-    # in CoolProp 6.3.0
+    @pytest.mark.parametrize("pair, vals", UNSUPPORTED_PAIRS)
     @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_hx(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.hx = Q_(1624328.2430353598, "J/kg"), Q_(0.5, "dimensionless")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(245769.34557103913, "Pa"))  # type: ignore
-        assert np.isclose(s.xT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.xT[0], Q_(0.5, "dimensionless"))  # type: ignore
-        assert np.isclose(s.u, Q_(1534461.5163075812, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(4329.703956664546, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(4056.471547685226, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(2913.7307270395363, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.3656547423394701, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1624328.2430353598, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.5, "dimensionless"))  # type: ignore
-
-    def test_set_sT(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.sT = Q_(7496.2021523754065, "J/(kg*K)"), Q_(400.0, "K")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.sT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.sT[0], Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_Ts(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.Ts = Q_(400.0, "K"), Q_(7496.2021523754065, "J/(kg*K)")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.Ts[0], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.Ts[1], Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_vT(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.vT = Q_(1.801983936953226, "m**3/kg"), Q_(400.0, "K")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.vT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.vT[0], Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_Tv(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.Tv = Q_(400.0, "K"), Q_(1.801983936953226, "m**3/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.Tv[0], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.Tv[1], Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(2547715.3635084038, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(7496.2021523754065, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(2009.2902478486988, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(1509.1482452129906, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(1.801983936953226, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(2730301.3859201893, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_xT(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.xT = Q_(0.5, "dimensionless"), Q_(400.0, "K")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(245769.34557103913, "Pa"))  # type: ignore
-        assert np.isclose(s.xT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.xT[0], Q_(0.5, "dimensionless"))  # type: ignore
-        assert np.isclose(s.u, Q_(1534461.5163075812, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(4329.703956664546, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(4056.471547685226, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(2913.7307270395363, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.3656547423394701, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1624328.2430353598, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.5, "dimensionless"))  # type: ignore
-        s.xT = Q_(50, "percent"), Q_(400.0, "K")
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(245769.34557103913, "Pa"))  # type: ignore
-        assert np.isclose(s.xT[1], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.xT[0], Q_(0.5, "dimensionless"))  # type: ignore
-        assert np.isclose(s.u, Q_(1534461.5163075812, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(4329.703956664546, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(4056.471547685226, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(2913.7307270395363, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.3656547423394701, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1624328.2430353598, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.5, "dimensionless"))  # type: ignore
-
-    def test_set_Tx(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.Tx = Q_(400.0, "K"), Q_(0.5, "dimensionless")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(245769.34557103913, "Pa"))  # type: ignore
-        assert np.isclose(s.Tx[0], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.Tx[1], Q_(0.5, "dimensionless"))  # type: ignore
-        assert np.isclose(s.u, Q_(1534461.5163075812, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(4329.703956664546, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(4056.471547685226, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(2913.7307270395363, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.3656547423394701, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1624328.2430353598, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.5, "dimensionless"))  # type: ignore
-        s.Tx = Q_(400.0, "K"), Q_(50, "percent")
-        assert np.isclose(s.T, Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(245769.34557103913, "Pa"))  # type: ignore
-        assert np.isclose(s.Tx[0], Q_(400.0, "K"))  # type: ignore
-        assert np.isclose(s.Tx[1], Q_(0.5, "dimensionless"))  # type: ignore
-        assert np.isclose(s.u, Q_(1534461.5163075812, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(4329.703956664546, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cp, Q_(4056.471547685226, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.cv, Q_(2913.7307270395363, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.3656547423394701, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1624328.2430353598, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.5, "dimensionless"))  # type: ignore
-
-    def test_set_pu(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.pu = Q_(101325.0, "Pa"), Q_(1013250.0, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pu[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pu[1], Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.pu = Q_(101325.0, "Pa"), Q_(3013250.0, "J/kg")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pu[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pu[1], Q_(3013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_up(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.up = Q_(1013250.0, "J/kg"), Q_(101325.0, "Pa")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.up[0], Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.up[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.up = Q_(3013250.0, "J/kg"), Q_(101325.0, "Pa")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.up[0], Q_(3013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.up[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_ps(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.ps = Q_(101325.0, "Pa"), Q_(3028.9867985920914, "J/(kg*K)")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ps[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ps[1], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.ps = Q_(101325.0, "Pa"), Q_(8623.283568815832, "J/(kg*K)")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ps[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ps[1], Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_sp(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.sp = Q_(3028.9867985920914, "J/(kg*K)"), Q_(101325.0, "Pa")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.sp[0], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.sp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.sp = Q_(8623.283568815832, "J/(kg*K)"), Q_(101325.0, "Pa")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.sp[0], Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.sp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_pv(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.pv = Q_(101325.0, "Pa"), Q_(0.4772010021515822, "m**3/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pv[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pv[1], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.pv = Q_(101325.0, "Pa"), Q_(3.189303132125469, "m**3/kg")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pv[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.pv[1], Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_vp(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.vp = Q_(0.4772010021515822, "m**3/kg"), Q_(101325.0, "Pa")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.vp[0], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.vp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.vp = Q_(3.189303132125469, "m**3/kg"), Q_(101325.0, "Pa")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.vp[0], Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.vp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_ph(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.ph = Q_(101325.0, "Pa"), Q_(1061602.391543017, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ph[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ph[1], Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.ph = Q_(101325.0, "Pa"), Q_(3336406.139862406, "J/kg")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ph[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.ph[1], Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_hp(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.hp = Q_(1061602.391543017, "J/kg"), Q_(101325.0, "Pa")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.hp[0], Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.hp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-        s.hp = Q_(3336406.139862406, "J/kg"), Q_(101325.0, "Pa")
-        assert np.isclose(s.T, Q_(700.9882316847855, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.hp[0], Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert np.isclose(s.hp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(3013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(8623.283568815832, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(3.189303132125469, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(3336406.139862406, "J/kg"))  # type: ignore
-        assert s.x is None
-
-    def test_set_px(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.px = Q_(101325.0, "Pa"), Q_(0.28475636946248034, "dimensionless")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.px[0], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.px[1], Q_(0.2847563694624, "dimensionless"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_xp(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.xp = Q_(0.28475636946248034, "dimensionless"), Q_(101325.0, "Pa")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.xp[0], Q_(0.2847563694624, "dimensionless"))  # type: ignore
-        assert np.isclose(s.xp[1], Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    # This set of tests fails because s and u are not valid inputs for PhaseSI
-    # in CoolProp 6.1.0
-    @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_us(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.us = Q_(1013250.0, "J/kg"), Q_(3028.9867985920914, "J/(kg*K)")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.us[0], Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.us[1], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    @pytest.mark.xfail(strict=True, raises=StateError)
-    def test_set_su(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.su = Q_(3028.9867985920914, "J/(kg*K)"), Q_(1013250.0, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.su[0], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.su[1], Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_uv(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.uv = Q_(1013250.0, "J/kg"), Q_(0.4772010021515822, "m**3/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.uv[0], Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.uv[1], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_vu(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.vu = Q_(0.4772010021515822, "m**3/kg"), Q_(1013250.0, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.vu[0], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.vu[1], Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_sv(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.sv = Q_(3028.9867985920914, "J/(kg*K)"), Q_(0.4772010021515822, "m**3/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.sv[0], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.sv[1], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_vs(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.vs = Q_(0.4772010021515822, "m**3/kg"), Q_(3028.9867985920914, "J/(kg*K)")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.vs[0], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.vs[1], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_sh(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.sh = Q_(3028.9867985920914, "J/(kg*K)"), Q_(1061602.391543017, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.sh[0], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.sh[1], Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_hs(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.hs = Q_(1061602.391543017, "J/kg"), Q_(3028.9867985920914, "J/(kg*K)")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.hs[0], Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.hs[1], Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_vh(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.vh = Q_(0.4772010021515822, "m**3/kg"), Q_(1061602.391543017, "J/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.vh[0], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.vh[1], Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250.0, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_set_hv(self):
-        """Set a pair of properties of the State and check the properties.
-
-        Also works as a functional/regression test of CoolProp.
-        """
-        s = State(substance="water")
-        s.hv = Q_(1061602.391543017, "J/kg"), Q_(0.4772010021515822, "m**3/kg")
-        # Pylance does not support NumPy ufuncs
-        assert np.isclose(s.T, Q_(373.1242958476843, "K"))  # type: ignore
-        assert np.isclose(s.p, Q_(101325.0, "Pa"))  # type: ignore
-        assert np.isclose(s.hv[0], Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.hv[1], Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.u, Q_(1013250, "J/kg"))  # type: ignore
-        assert np.isclose(s.s, Q_(3028.9867985920914, "J/(kg*K)"))  # type: ignore
-        assert np.isclose(s.v, Q_(0.4772010021515822, "m**3/kg"))  # type: ignore
-        assert np.isclose(s.h, Q_(1061602.391543017, "J/kg"))  # type: ignore
-        assert np.isclose(s.x, Q_(0.28475636946248034, "dimensionless"))  # type: ignore
-
-    def test_state_units_EE(self):
+    def test_set_unsupported_pair(self, water, pair, vals):
+        """Setting an unsupported pair of properties raises a StateError."""
+        setattr(water, pair, vals)
+
+    def test_from_arrays(self):
+        """Compute the properties of several states with one call per property."""
+        p = Q_(np.full(2, P_ATM.m), PA)
+        h = Q_(np.array([H_SAT.m, H_SH.m]), J_KG)
+        states = State.from_arrays("water", "ph", p, h)
+        assert len(states) == 2
+        for i, expected in enumerate((EXPECTED_SAT, EXPECTED_SUPERHEATED)):
+            check_state(point(states, i), **expected)
+        assert np.isnan(states.x[1])
+        assert list(states.phase) == ["twophase", "supercritical_gas"]
+
+    def test_from_arrays_broadcast_units(self):
+        """Scalar inputs are broadcast and the output units can be set."""
+        states = State.from_arrays("water", "Tp", T_ARRAY, P_ATM, units="EE")
+        assert states.T.units == "degree_Fahrenheit"
+        assert states.h.units == "british_thermal_unit / pound"
+        assert states.p.shape == (2,)
+        check_state(point(states, 1), **EXPECTED_GAS)
+        states.units = "SI"
+        assert states.h.units == "kilojoule / kilogram"
+
+    def test_from_arrays_failed_point(self):
+        """Points that CoolProp can't solve are NaN."""
+        T = Q_(np.array([400.0, 373.1242958476843]), K)
+        states = State.from_arrays("water", "Tp", T, P_ATM)
+        assert not np.isnan(states.h[0].m)
+        assert np.isnan(states.h[1].m)
+        assert states.phase[1] == "unknown"
+
+    @pytest.mark.parametrize(
+        "pair, values, exc, match",
+        [
+            pytest.param("Th", (T400, H_GAS), StateError, "isn't supported", id="Th"),
+            pytest.param("TT", (T400, T300), AttributeError, "Unknown", id="TT"),
+            pytest.param(
+                "Tp", (T400, BAD_DIMENSION), StateError, "dimensions", id="dimension"
+            ),
+            pytest.param(
+                "Tp",
+                (Q_(np.array([400.0, -1.0]), K), P_ATM),
+                StateError,
+                "must be positive",
+                id="negative",
+            ),
+        ],
+    )
+    def test_from_arrays_bad_inputs(self, pair, values, exc, match):
+        """Bad pairs and inputs raise before CoolProp is called."""
+        with pytest.raises(exc, match=match):
+            State.from_arrays("water", pair, *values)
+
+    def test_state_units_EE(self, build_state):
         """Set a state with EE units and check the properties."""
-        s = State("water", T=Q_(100, "degC"), p=Q_(1.0, "atm"), units="EE")
+        s = build_state("water", T=T_BOIL, p=ONE_ATM, units="EE")
         assert s.units == "EE"
         assert s.cv.units == "british_thermal_unit / degree_Rankine / pound"
         assert s.cp.units == "british_thermal_unit / degree_Rankine / pound"
@@ -951,9 +660,9 @@ class TestState(object):
         assert s.v.units == "foot ** 3 / pound"
         assert s.p.units == "pound_force_per_square_inch"
 
-    def test_state_units_SI(self):
+    def test_state_units_SI(self, build_state):
         """Set a state with SI units and check the properties."""
-        s = State("water", T=Q_(100, "degC"), p=Q_(1.0, "atm"), units="SI")
+        s = build_state("water", T=T_BOIL, p=ONE_ATM, units="SI")
         assert s.units == "SI"
         assert s.cv.units == "kilojoule / kelvin / kilogram"
         assert s.cp.units == "kilojoule / kelvin / kilogram"
@@ -966,26 +675,54 @@ class TestState(object):
 
     def test_default_units(self):
         """Set default units and check for functionality."""
-        s = State("water", T=Q_(100, "degC"), p=Q_(1.0, "atm"))
+        s = State("water", T=T_BOIL, p=ONE_ATM)
         assert s.units is None
         set_default_units("SI")
-        s2 = State("water", T=Q_(100, "degC"), p=Q_(1.0, "atm"))
+        s2 = State("water", T=T_BOIL, p=ONE_ATM)
         assert s2.units == "SI"
         set_default_units("EE")
-        s3 = State("water", T=Q_(100, "degC"), p=Q_(1.0, "atm"))
+        s3 = State("water", T=T_BOIL, p=ONE_ATM)
         assert s3.units == "EE"
         set_default_units(None)
 
     def test_unsupported_units(self):
         """Unsupported unit names should raise TypeError."""
-        with pytest.raises(TypeError):
+        with pytest.raises(TypeError, match="The given units 'bad' are not"):
             set_default_units("bad")
-        with pytest.raises(TypeError):
-            State("water", T=Q_(100, "degC"), p=Q_(1.0, "atm"), units="bad")
+        with pytest.raises(TypeError, match="The given units 'bad' are not"):
+            State("water", T=T_BOIL, p=ONE_ATM, units="bad")
+
+    @pytest.mark.parametrize("system", ["SI", "EE"])
+    def test_units_match_pint(self, ref_gas_state, build_state, system):
+        """The converted properties match converting the SI properties with pint."""
+        s = build_state("water", T=T400, p=P_ATM, units=system)
+        for prop in ALL_UNIT_PROPS - {"x"}:
+            expected = getattr(ref_gas_state, prop).to(getattr(s, prop).units)
+            assert approx_q(getattr(s, prop), expected, rel=1e-14)
+        # Temperatures have an offset, so check them exactly as well
+        assert s.T.m == ref_gas_state.T.to(s.T.units).m
+
+    def test_temperature_units_exact(self):
+        """Temperatures round-trip through degF exactly, as they do with pint."""
+        s = State("water", T=T400, p=P_ATM, units="EE")
+        assert s.T.m == T400.to("degF").m == 260.33
+        s.Tp = Q_(260.33, "degF"), P_ATM
+        assert s.T.m_as("K") == 400.0
+        assert s.to_PropsSI("T", Q_(260.33, "degF")) == 400.0
+
+    @pytest.mark.parametrize("system", ["SI", "EE"])
+    def test_inputs_in_system_units(self, ref_gas_state, system):
+        """Inputs in the units of a system are converted to SI like pint does."""
+        for prop in ALL_UNIT_PROPS - {"x"}:
+            value = getattr(ref_gas_state, prop).to(UNITS[system, prop])
+            expected = value.m_as(State._SI_units[prop])
+            assert math.isclose(
+                ref_gas_state.to_PropsSI(prop, value), expected, rel_tol=1e-14
+            )
 
     def test_change_units(self):
         """Change state units and check variable units have changed."""
-        s = State("water", T=Q_(100, "degC"), p=Q_(1.0, "atm"), units="EE")
+        s = State("water", T=T_BOIL, p=ONE_ATM, units="EE")
         assert s.units == "EE"
         s.units = "SI"
         assert s.units == "SI"
@@ -997,3 +734,51 @@ class TestState(object):
         assert s.u.units == "kilojoule / kilogram"
         assert s.v.units == "meter ** 3 / kilogram"
         assert s.p.units == "bar"
+
+
+class TestStateArray(object):
+    """Test the functions of the StateArray object."""
+
+    def test_init(self):
+        """Construct a StateArray from keyword arguments and read a pair back."""
+        states = StateArray("water", T=T_ARRAY, p=P_ATM)
+        assert states.sub == "WATER"
+        check_state(point(states, 1), **EXPECTED_GAS)
+        T, p = states.Tp
+        assert T.shape == p.shape == (2,)
+
+    def test_no_properties(self):
+        """A StateArray without input properties can have a pair set later."""
+        states = StateArray("water")
+        states.Tp = (T400, P_ATM)
+        check_state(point(states, ()), **EXPECTED_GAS)
+
+    def test_len(self):
+        """The length is the number of states, including for scalar inputs."""
+        assert len(StateArray("water", T=T400, p=P_ATM)) == 1
+        assert len(StateArray("water", T=T_ARRAY, p=P_ATM)) == 2
+        T = Q_(np.full((2, 3), T400.m), K)
+        assert len(StateArray("water", T=T, p=P_ATM)) == 6
+
+    def test_unset_properties(self):
+        """Properties can't be read until a pair is set, and the array is empty."""
+        states = StateArray("water")
+        assert len(states) == 0
+        for prop in ("T", "phase", "Tp"):
+            with pytest.raises(AttributeError, match="not available until a pair"):
+                getattr(states, prop)
+        with pytest.raises(AttributeError, match="Unknown attribute"):
+            states.bad
+
+    def test_bad_arguments(self):
+        """Bad arguments raise the same errors as `State`."""
+        with pytest.raises(ValueError, match="is not an allowed substance"):
+            StateArray("bad")
+        with pytest.raises(ValueError, match="Incorrect number"):
+            StateArray("water", T=T400)
+        with pytest.raises(ValueError, match="The argument"):
+            StateArray("water", T=T400, a=P_ATM)
+        with pytest.raises(TypeError, match="The given units"):
+            StateArray("water", units="bad")
+        with pytest.raises(AttributeError):
+            StateArray("water").label = "bad"